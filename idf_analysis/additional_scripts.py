@@ -1,6 +1,7 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib import ticker
 from matplotlib.lines import Line2D
 from webbrowser import open as show_file
 
@@ -20,16 +21,25 @@ def measured_points(idf, return_periods, interim_results=None, max_duration=None
         max_duration (float): max duration in [min]
 
     Returns:
-        pd.Series: series with duration as index and the height of the rainfall as data
+        pd.Series | pd.DataFrame: series with duration as index and the height of the rainfall as data
+                                  (data-frame with the return periods as columns if multiple are given)
     """
     if interim_results is None:
         interim_results = idf.parameters.get_interim_results()
 
     if max_duration is not None:
-        interim_results = interim_results.loc[:max_duration].copy()
+        interim_results = interim_results.loc[:max_duration]
 
-    return pd.Series(index=interim_results.index,
-                     data=interim_results['u'] + interim_results['w'] * np.log(return_periods))
+    u = interim_results['u'].to_numpy()
+    w = interim_results['w'].to_numpy()
+
+    if np.ndim(return_periods) == 0:
+        return pd.Series(index=interim_results.index, data=u + w * np.log(return_periods))
+
+    # all return periods at once
+    log_tn = np.log(np.asarray(return_periods, dtype=float))
+    return pd.DataFrame(index=interim_results.index, columns=list(return_periods),
+                        data=u[:, np.newaxis] + w[:, np.newaxis] * log_tn[np.newaxis, :])
 
 
 def return_period_scatter(idf, filename='all_events_max_return_period.pdf', min_return_period=0.5, durations=None):
@@ -93,6 +103,25 @@ def return_period_scatter(idf, filename='all_events_max_return_period.pdf', min_
     plt.close(fig)
 
 
+def _duration_tick_label(minutes):
+    """
+    label for the duration axis
+
+    Args:
+        minutes (float): duration in minutes
+
+    Returns:
+        str: label like "1h30min"
+    """
+    h, m = divmod(int(minutes), 60)
+    s = ''
+    if h:
+        s += '{}h'.format(h)
+    if m:
+        s += '{}min'.format(m)
+    return s
+
+
 def result_plot_v2(idf, filename, min_duration=5.0, max_duration=720.0, logx=False, show=False):
     duration_steps = np.arange(min_duration, max_duration + 1, 1)
     colors = ['r', 'g', 'b', 'y', 'm']
@@ -100,8 +129,8 @@ def result_plot_v2(idf, filename, min_duration=5.0, max_duration=720.0, logx=Fal
     # return_periods = [0.5, 1, 10, 50, 100]
     return_periods = [1, 2, 5, 10, 50]
 
+    # the x-axis stays in minutes (no conversion to timedelta and back), the tick labels below are made readable
     table = idf.result_table(durations=duration_steps, return_periods=return_periods)
-    table.index = pd.to_timedelta(table.index, unit='m')
     ax = table.plot(color=colors, logx=logx)
 
     ax.tick_params(axis='both', which='both', direction='out')
@@ -110,7 +139,6 @@ def result_plot_v2(idf, filename, min_duration=5.0, max_duration=720.0, logx=Fal
         return_time = return_periods[i]
         color = colors[i]
         p = measured_points(idf, return_time, max_duration=max_duration)
-        p.index = pd.to_timedelta(p.index, unit='m')
         ax.plot(p, color + 'x')
 
         # plt.text(max_duration * ((10 - offset) / 10), depth_of_rainfall(max_duration * ((10 - offset) / 10),
@@ -128,28 +156,12 @@ def result_plot_v2(idf, filename, min_duration=5.0, max_duration=720.0, logx=Fal
     else:
         pass
 
-    major_ticks = np.array([d * 60 * 1.0e9 for d in idf.duration_steps if d <= max_duration])
+    major_ticks = np.array([d for d in idf.duration_steps if d <= max_duration], dtype=np.float64)
     # minor_ticks = pd.date_range("00:00", "23:59", freq='15T').time
-    # print(major_ticks)
-    # exit()
-    ax.set_xticks(major_ticks)
-    # print(ax.get_xticks())
-    from matplotlib import ticker
-
-    def time_ticks(x, _):
-        x = pd.to_timedelta(x, unit='ns').total_seconds() / 60
-        h = int(x / 60)
-        m = int(x % 60)
-        s = ''
-        if h:
-            s += '{}h'.format(h)
-        if m:
-            s += '{}min'.format(m)
-        return s
-
-    formatter = ticker.FuncFormatter(time_ticks)
-    ax.xaxis.set_major_formatter(formatter)
-    # print(ax.get_xticks())
+    # labels are created only once and not on every redraw
+    ax.xaxis.set_major_locator(ticker.FixedLocator(major_ticks))
+    ax.set_xlim(table.index[0], table.index[-1])
+    ax.xaxis.set_major_formatter(ticker.FixedFormatter([_duration_tick_label(m) for m in major_ticks]))
     # plt.axis([0, max_duration, 0, depth_of_rainfall(max_duration,
     #                                                 return_periods[len(return_periods) - 1],
     #                                                 parameter_1, parameter_2) + 10])
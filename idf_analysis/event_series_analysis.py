@@ -7,7 +7,7 @@ import pandas as pd
 from tqdm import tqdm
 
 from .definitions import *
-from .sww_utils import year_delta, guess_freq, rain_events, agg_events
+from .sww_utils import year_delta, guess_freq, rain_events, cumulative_sum, rolling_sum, events_max
 
 
 def annual_series(rolling_sum_values, year_index):
@@ -144,6 +144,9 @@ def calculate_u_w(file_input, duration_steps, series_kind):
     # ------------------------------------------------------------------------------------------------------------------
     interim_results = dict()
 
+    # only one pass over the data for the rolling sums of all durations
+    cum_sum = cumulative_sum(ts)
+
     # -------------------------------
     # acc. to DWA-A 531 chap. 4.2:
     # The values must be independent of each other for the statistical evaluations.
@@ -168,14 +171,12 @@ def calculate_u_w(file_input, duration_steps, series_kind):
         # correction factor acc. to DWA-A 531 chap. 4.3
         improve = _improve_factor(duration / base_frequency)
 
-        roll_sum = ts.rolling(duration).sum()
+        roll_sum = rolling_sum(cum_sum, ts.index, duration)
 
         # events[COL.rolling_sum_valuesAX_OVERLAPPING_SUM] = agg_events(events, roll_sum, 'max') * improve
-        rolling_sum_values = agg_events(events, roll_sum, 'max') * improve
+        rolling_sum_values = events_max(events, ts.index, roll_sum) * improve
 
-        year_list = []
-        for e in events[COL.START]:
-            year_list.append(e.year)
+        year_list = events[COL.START].dt.year.values
 
         if series_kind == ANNUAL:
             interim_results[duration_integer] = annual_series(rolling_sum_values, year_list)
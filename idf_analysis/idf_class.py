@@ -7,7 +7,8 @@ __license__ = "MIT"
 
 import warnings
 from math import floor
-from os import path, mkdir
+from os import path
+from pathlib import Path
 from webbrowser import open as show_file
 from scipy.optimize import newton
 
@@ -19,11 +20,11 @@ from tqdm import tqdm
 
 from .arg_parser import heavy_rain_parser
 from .idf_parameters import IdfParameters
-from .little_helpers import minutes_readable, height2rate, delta2min, rate2height, frame_looper, event_caption
+from .little_helpers import minutes_readable, delta2min, rate2height, frame_looper, event_caption, HEIGHT2RATE
 from .definitions import *
 from .in_out import import_series
 from .sww_utils import (remove_timezone, guess_freq, rain_events, agg_events, event_duration, resample_rain_series,
-                        rain_bar_plot, IdfError, )
+                        rain_bar_plot, IdfError, cumulative_sum, rolling_sum, )
 from .plot_helpers import idf_bar_axes
 from .additional_scripts import measured_points
 
@@ -70,6 +71,7 @@ class IntensityDurationFrequencyAnalyse:
         self._duration_steps += [i * 60 for i in [2, 3, 4, 6, 9, 12, 18]]  # duration steps in hours
         if extended_durations:
             self._duration_steps += [i * 60 * 24 for i in [1, 2, 3, 4, 5, 6]]  # duration steps in days
+        self._duration_steps = np.array(self._duration_steps, dtype=np.int64)
 
     # __________________________________________________________________________________________________________________
     @property
@@ -100,7 +102,8 @@ class IntensityDurationFrequencyAnalyse:
 
         self._freq = guess_freq(series.index)
         freq_minutes = delta2min(self._freq)
-        self.duration_steps = list(filter(lambda d: d >= freq_minutes, self.duration_steps))
+        # the duration steps are sorted, so only the shorter durations at the beginning have to be removed
+        self.duration_steps = self.duration_steps[np.searchsorted(self.duration_steps, freq_minutes, side='left'):]
         self.series = series.replace(0, np.NaN).dropna()
         self._return_periods_frame = None
         self._rain_events = None
@@ -111,7 +114,7 @@ class IntensityDurationFrequencyAnalyse:
         """
         get duration steps (in minutes) for the parameter calculation and basic evaluations
         Returns:
-            list | numpy.ndarray: duration steps in minutes
+            numpy.ndarray: duration steps in minutes
         """
         if self._duration_steps is None:
             raise IdfError('No Series defined for IDF-Analysis!')
@@ -126,7 +129,8 @@ class IntensityDurationFrequencyAnalyse:
         """
         if not isinstance(durations, (list, np.ndarray)):
             raise IdfError('Duration steps have to be {} got "{}"'.format((list, np.ndarray), type(durations)))
-        self._duration_steps = durations
+        # sorted, because set_series only cuts off the durations at the beginning
+        self._duration_steps = np.sort(np.asarray(durations, dtype=np.int64))
 
     # __________________________________________________________________________________________________________________
     @property
@@ -200,20 +204,62 @@ class IntensityDurationFrequencyAnalyse:
         Returns:
             int | float | list | numpy.ndarray | pandas.Series: height of the rainfall h in L/m² = mm
         """
+        return self._depth_of_rainfall(duration, self._log_return_period(return_period))
+
+    def _depth_of_rainfall(self, duration, log_tn):
+        """
+        calculate the height of the rainfall h in L/m² = mm with the already calculated logarithmic term of the return
+        period (see :func:`IntensityDurationFrequencyAnalyse._log_return_period`)
+
+        Args:
+            duration (int | float | list | numpy.ndarray): duration: in minutes
+            log_tn (float | numpy.ndarray): logarithmic term of the return period
+
+        Returns:
+            int | float | numpy.ndarray: height of the rainfall h in L/m² = mm
+        """
+        u, w = self.get_u_w(duration)
+        return u + w * log_tn
+
+    def depth_of_rainfall_grid(self, durations, return_periods):
+        """
+        calculate the height of the rainfall h in L/m² = mm for every combination of the durations and return periods
+
+        Args:
+            durations (list | numpy.ndarray): in minutes
+            return_periods (list | numpy.ndarray): in years
+
+        Returns:
+            numpy.ndarray: height of the rainfall h in L/m² = mm with the durations as rows and
+                           the return periods as columns
+        """
+        u, w = self.get_u_w(np.asarray(durations))
+        log_tn = np.asarray(self._log_return_period(return_periods))
+        return u[:, np.newaxis] + w[:, np.newaxis] * log_tn[np.newaxis, :]
+
+    def _log_return_period(self, return_period):
+        """
+        logarithmic term of the return period in the distribution function depending on the series kind
+
+        Args:
+            return_period (float | list | numpy.ndarray): in years
+
+        Returns:
+            float | numpy.ndarray: logarithmic term of the return period
+        """
         if self.series_kind == ANNUAL:
-            if return_period < 5:
+            return_period = np.asarray(return_period, dtype=float)
+            if np.any(return_period < 5):
                 print('WARNING: Using an annual series and a return period < 5 a will result in faulty values!')
 
-            if return_period <= 10:
-                return_period = np.exp(1.0 / return_period) / (np.exp(1.0 / return_period) - 1.0)
+            return_period = np.where(return_period <= 10,
+                                     np.exp(1.0 / return_period) / (np.exp(1.0 / return_period) - 1.0),
+                                     return_period)
 
-            log_tn = -np.log(np.log(return_period / (return_period - 1.0)))
+            return -np.log(np.log(return_period / (return_period - 1.0)))
 
         else:
-            log_tn = np.log(return_period)
-
-        u, w = self.get_u_w(duration)
-        return u + w * log_tn
+            return np.log(return_period)
 
     # __________________________________________________________________________________________________________________
     def rain_flow_rate(self, duration, return_period):
@@ -229,8 +275,31 @@ class IntensityDurationFrequencyAnalyse:
         Returns:
                 int | float | list | numpy.ndarray | pandas.Series: specific rain flow rate in [l/(s*ha)]
         """
-        height_of_rainfall = self.depth_of_rainfall(duration=duration, return_period=return_period)
-        return height2rate(height_of_rainfall=height_of_rainfall, duration=duration)
+        return self._fused_rain_flow(duration=duration, return_period=return_period)
+
+    def _fused_rain_flow(self, duration, return_period):
+        """
+        same as :func:`height2rate` of :func:`IntensityDurationFrequencyAnalyse.depth_of_rainfall`,
+        but for array-like durations all the calculation steps are done in a single output array
+
+        Args:
+            duration (int | float | list | numpy.ndarray): in minutes
+            return_period (float): in years
+
+        Returns:
+            int | float | numpy.ndarray: specific rain flow rate in [l/(s*ha)]
+        """
+        u, w = self.get_u_w(duration)
+        log_tn = self._log_return_period(return_period)
+
+        if np.ndim(u) == 0:
+            return (u + w * log_tn) * HEIGHT2RATE / duration
+
+        rate = np.multiply(w, log_tn)
+        np.add(rate, u, out=rate)
+        np.multiply(rate, HEIGHT2RATE, out=rate)
+        np.divide(rate, duration, out=rate)
+        return rate
 
     # __________________________________________________________________________________________________________________
     def r_720_1(self):
@@ -257,6 +326,22 @@ class IntensityDurationFrequencyAnalyse:
         u, w = self.get_u_w(duration)
         return np.exp((height_of_rainfall - u) / w)
 
+    def return_periods_matrix(self, heights, durations):
+        """
+        calculate the return periods for a matrix of rainfall heights, where each column belongs to one duration
+
+        Args:
+            heights (numpy.ndarray): heights of rainfall in [mm] with the shape (N, D)
+            durations (list | numpy.ndarray): durations in minutes of the columns with the length D
+
+        Returns:
+            numpy.ndarray: return periods in years with the shape (N, D)
+        """
+        # stay in single precision if the heights are given in single precision
+        dtype = np.result_type(heights, np.float32)
+        u, w = (np.asarray(p, dtype=dtype) for p in self.get_u_w(np.asarray(durations)))
+        return np.exp((heights - u[np.newaxis, :]) / w[np.newaxis, :])
+
     # __________________________________________________________________________________________________________________
     def get_duration(self, height_of_rainfall, return_period):
         """
@@ -269,7 +354,9 @@ class IntensityDurationFrequencyAnalyse:
         Returns:
             float: duration in minutes
         """
-        return newton(lambda d: self.depth_of_rainfall(d, return_period) - height_of_rainfall, x0=1)
+        # the return period is the same for every iteration
+        log_tn = self._log_return_period(return_period)
+        return newton(lambda d: self._depth_of_rainfall(d, log_tn) - height_of_rainfall, x0=1)
 
     # __________________________________________________________________________________________________________________
     def result_table(self, durations=None, return_periods=None, add_names=False):
@@ -290,11 +377,8 @@ class IntensityDurationFrequencyAnalyse:
         if return_periods is None:
             return_periods = [1, 2, 3, 5, 10, 20, 25, 30, 50, 75, 100]
 
-        result_table = dict()
-        for t in return_periods:
-            result_table[t] = self.depth_of_rainfall(durations, t)
-
-        result_table = pd.DataFrame(result_table, index=durations)
+        result_table = pd.DataFrame(self.depth_of_rainfall_grid(durations, return_periods),
+                                    index=durations, columns=return_periods)
 
         if add_names:
             result_table.index.name = 'duration (min)'
@@ -345,11 +429,9 @@ class IntensityDurationFrequencyAnalyse:
         # use the same directory as the input file and make as subdir with the name of the input_file + "_idf_data"
         out = '{label}_idf_data'.format(label='.'.join(user.input.split('.')[:-1]))
 
-        if not path.isdir(out):
-            mkdir(out)
-            action = 'Creating'
-        else:
-            action = 'Using'
+        action = 'Using' if path.isdir(out) else 'Creating'
+        # also creates missing parent folders and doesn't fail if the folder was created in the meantime
+        Path(out).mkdir(parents=True, exist_ok=True)
 
         print('{} the subfolder "{}" for the interim- and final-results.'.format(action, out))
 
@@ -442,30 +524,33 @@ class IntensityDurationFrequencyAnalyse:
         if series is None:
             if self._rainfall_sum_frame is not None:
                 return self._rainfall_sum_frame
-            ts = self.series.copy()
+            ts = self.series
             freq = self._freq
         else:
             freq = guess_freq(series.index)
-            ts = series.copy()
-            ts = ts.asfreq(freq).fillna(0)
+            ts = series.asfreq(freq).fillna(0)
             # ts = series.replace(0, np.NaN).dropna()
 
-        df = pd.DataFrame(index=ts.index)
-        # df = dict()
+        # the final array is allocated only once and filled column by column
+        # single precision is enough for the heights and halves the memory of these big frames
+        sums = np.empty((ts.index.size, len(durations)), dtype=np.float32)
 
         freq_num = delta2min(freq)
 
-        for d in frame_looper(ts.index.size, columns=durations, label='rainfall_sum'):
+        # only one pass over the data for all durations
+        cum_sum = cumulative_sum(ts)
+
+        for i, d in enumerate(frame_looper(ts.index.size, columns=durations, label='rainfall_sum')):
             if d % freq_num != 0:
                 warnings.warn('Using durations (= {} minutes), '
                               'which are not a multiple of the base frequency (= {} minutes) of the series, '
                               'will lead to misinterpretations.'.format(d, freq_num))
-            df[d] = ts.rolling(pd.Timedelta(minutes=d)).sum()
+            sums[:, i] = rolling_sum(cum_sum, ts.index, pd.Timedelta(minutes=d))
 
         # printable_names (bool): if durations should be as readable in dataframe, else in minutes
         # df = df.rename(minutes_readable, axis=0)
 
-        return df#.round(2)
+        return pd.DataFrame(sums, index=ts.index, columns=durations, copy=False)#.round(2)
 
     @property
     def rainfall_sum_frame(self):
@@ -491,11 +576,10 @@ class IntensityDurationFrequencyAnalyse:
             pandas.DataFrame: return periods depending of the duration per datetimeindex
         """
         sums = self.get_rainfall_sum_frame(series=series, durations=durations)
-        df = pd.DataFrame(index=sums.index)
-        # df = dict()
-        for d in frame_looper(sums.index.size, columns=sums.columns, label='return_periods'):
-            df[d] = self.get_return_period(height_of_rainfall=sums[d][sums[d] > 0.1], duration=d)
-        return df#.fillna(0)#.round(2)
+        heights = sums.to_numpy()
+        heights = np.where(heights > 0.1, heights, np.NaN)
+        return_periods = self.return_periods_matrix(heights, sums.columns)
+        return pd.DataFrame(return_periods, index=sums.index, columns=sums.columns)#.fillna(0)#.round(2)
 
     @property
     def return_periods_frame(self):
@@ -550,11 +634,19 @@ class IntensityDurationFrequencyAnalyse:
         return self._rain_events
 
     def write_rain_events(self, filename, sep=';', decimal='.'):
-        """save the rain-events dataframe as a csv-file for external use or to save computation time."""
-        self.rain_events.to_csv(filename, index=False, sep=sep, decimal=decimal)
+        """save the rain-events dataframe as a csv- or parquet-file for external use or to save computation time."""
+        if Path(filename).suffix == '.parquet':
+            self.rain_events.to_parquet(filename)
+        else:
+            self.rain_events.to_csv(filename, index=False, sep=sep, decimal=decimal)
 
     def read_rain_events(self, filename, sep=';', decimal='.'):
-        """read the rain-events dataframe as a csv-file to save computation time."""
+        """read the rain-events dataframe as a csv- or parquet-file to save computation time."""
+        if Path(filename).suffix == '.parquet':
+            # the parquet-file keeps the datetime and timedelta types
+            self._rain_events = pd.read_parquet(filename)
+            return
+
         events = pd.read_csv(filename, skipinitialspace=True, sep=sep, decimal=decimal)
         events[COL.START] = pd.to_datetime(events[COL.START])
         events[COL.END] = pd.to_datetime(events[COL.END])
@@ -563,7 +655,7 @@ class IntensityDurationFrequencyAnalyse:
         self._rain_events = events
 
     def auto_save_rain_events(self, filename, sep=';', decimal='.'):
-        """auto-save the rain-events dataframe as a csv-file to save computation time."""
+        """auto-save the rain-events dataframe as a csv- or parquet-file to save computation time."""
         if path.isfile(filename):
             self.read_rain_events(filename, sep=sep, decimal=decimal)
         else:
@@ -646,7 +738,7 @@ class IntensityDurationFrequencyAnalyse:
             rain_ax = fig.add_subplot(111)
 
         else:
-            if durations:
+            if durations is not None:
                 max_dur = max(durations)
             else:
                 max_dur = max(self.duration_steps)
@@ -217,21 +217,37 @@ class IdfParameters:
             if row[PARAM_COL.FROM] <= duration <= row[PARAM_COL.TO]:
                 return row
 
-    def get_scalar_param(self, p, duration):
+    def get_row_masks(self, duration):
         """
+        get the row for each duration (like :func:`IdfParameters.get_row`) for a whole array at once
 
         Args:
-            p (str): name of the parameter 'u' or 'w'
-            duration (float | int): in minutes
+            duration (numpy.ndarray): in minutes
 
         Returns:
-            (float, float): u, w
+            list[tuple[dict, numpy.ndarray]]: row and boolean mask of the durations in the range of this row
+        """
+        row_masks = list()
+        unassigned = np.ones(duration.shape, dtype=bool)
+        for row in self._data:
+            mask = unassigned & (row[PARAM_COL.FROM] <= duration) & (duration <= row[PARAM_COL.TO])
+            if mask.any():
+                unassigned &= ~mask
+                row_masks.append((row, mask))
+        return row_masks
+
+    @staticmethod
+    def _get_param(row, p, duration):
         """
-        row = self.get_row(duration)
 
-        if row is None:
-            return np.NaN
+        Args:
+            row (dict): parameter row of the duration range
+            p (str): name of the parameter 'u' or 'w'
+            duration (float | int | numpy.ndarray): in minutes
 
+        Returns:
+            float | numpy.ndarray: parameter
+        """
         approach = row[p]
 
         if approach == LOG1:
@@ -252,17 +268,42 @@ class IdfParameters:
         elif approach == LIN:
             return np.interp(duration, row[COL.DUR], row[PARAM_COL.VALUES(p)])
 
-    def get_array_param(self, p, duration):
+    def get_scalar_param(self, p, duration):
+        """
+
+        Args:
+            p (str): name of the parameter 'u' or 'w'
+            duration (float | int): in minutes
+
+        Returns:
+            float: parameter
+        """
+        row = self.get_row(duration)
+
+        if row is None:
+            return np.NaN
+
+        return self._get_param(row, p, duration)
+
+    def get_array_param(self, p, duration, row_masks=None):
         """
 
         Args:
             p (str): name of the parameter 'u' or 'w'
             duration (numpy.ndarray): in minutes
+            row_masks (list[tuple[dict, numpy.ndarray]]): result of :func:`IdfParameters.get_row_masks`
 
         Returns:
-            (numpy.ndarray, numpy.ndarray): u, w
+            numpy.ndarray: parameter
         """
-        return np.vectorize(lambda d: self.get_scalar_param(p, d))(duration)
+        duration = np.asarray(duration, dtype=float)
+        if row_masks is None:
+            row_masks = self.get_row_masks(duration)
+
+        param = np.full(duration.shape, np.NaN)
+        for row, mask in row_masks:
+            param[mask] = self._get_param(row, p, duration[mask])
+        return param
 
     def get_u_w(self, duration):
         """
@@ -274,11 +315,15 @@ class IdfParameters:
             (float, float): u, w
         """
         if isinstance(duration, (list, np.ndarray)):
-            func = self.get_array_param
-        else:
-            func = self.get_scalar_param
+            # look up the duration ranges only once for both parameters
+            duration = np.asarray(duration, dtype=float)
+            row_masks = self.get_row_masks(duration)
+            return tuple(self.get_array_param(p, duration, row_masks=row_masks) for p in PARAM.U_AND_W)
 
-        return (func(p, duration) for p in PARAM.U_AND_W)
+        row = self.get_row(duration)
+        if row is None:
+            return np.NaN, np.NaN
+        return tuple(self._get_param(row, p, duration) for p in PARAM.U_AND_W)
 
     @classmethod
     def from_interim_results_file(cls, interim_results_fn, worksheet=DWA):
@@ -10,6 +10,9 @@ from tqdm import tqdm
 
 from idf_analysis.definitions import COL
 
+# conversion factor from the height of rainfall per duration in [mm/min] to the rain flow rate in [l/(s*ha)]
+HEIGHT2RATE = 1000 / 6
+
 
 def delta2min(time_delta):
     """
@@ -82,7 +85,7 @@ def height2rate(height_of_rainfall, duration):
     Returns:
         float | np.ndarray | pd.Series: specific rain flow rate in [l/(s*ha)]
     """
-    return height_of_rainfall / duration * (1000 / 6)
+    return height_of_rainfall / duration * HEIGHT2RATE
 
 
 def rate2height(rain_flow_rate, duration):
@@ -98,7 +101,7 @@ def rate2height(rain_flow_rate, duration):
     Returns:
         float | np.ndarray | pd.Series: height of rainfall in [mm]
     """
-    return rain_flow_rate * duration / (1000 / 6)
+    return rain_flow_rate * duration / HEIGHT2RATE
 
 
 def frame_looper(size, columns, label='return periods'):
@@ -11,6 +11,7 @@ import numpy as np
 import pandas as pd
 import pytz
 from pandas.tseries.frequencies import to_offset
+from pandas.tseries.offsets import Tick
 
 from .definitions import COL
 
@@ -148,6 +149,52 @@ def rain_events(series, ignore_rain_below=0, min_gap=pd.Timedelta(hours=4)):
     return events
 
 
+########################################################################################################################
+def cumulative_sum(series):
+    """
+    cumulative sum of the series with a leading zero, to get the rolling sums by differencing
+
+    Args:
+        series (pandas.Series): time-series data
+
+    Returns:
+        numpy.ndarray: cumulative sum (size of the series + 1)
+    """
+    return np.concatenate(([0.0], np.nancumsum(series.to_numpy(dtype=np.float64))))
+
+
+def rolling_sum(cum_sum, index, window):
+    """
+    rolling sum over a time-based window using the difference of the cumulative sum
+    (same result as ``series.rolling(window).sum()`` but without the windowed pandas path)
+
+    Args:
+        cum_sum (numpy.ndarray): cumulative sum of the series (see :func:`cumulative_sum`)
+        index (pandas.DatetimeIndex): index of the time-series
+        window (pandas.Timedelta): length of the window
+
+    Returns:
+        numpy.ndarray: rolling sum for every index
+    """
+    window = pd.Timedelta(window)
+    if index.empty or window > index[-1] - index[0]:
+        # the window covers the whole series: the rolling sum is just the cumulative sum
+        # rounded like below (also returns a new array and not a view of the shared cumulative sum)
+        return np.round(cum_sum[1:], 10)
+
+    if isinstance(index.freq, Tick):
+        # regular time steps: the window starts a fixed number of steps before
+        # the first values get the partial sums (like min_periods=1)
+        steps = int(np.ceil(window / pd.Timedelta(index.freq)))
+        window_start = np.clip(np.arange(index.size) - steps + 1, 0, None)
+    else:
+        times = index.values
+        window_start = np.searchsorted(times, times - window.to_timedelta64(), side='right')
+    # remove the floating point noise of the differencing (i.e. to get exactly 0.1 mm for a single value of 0.1 mm)
+    return np.round(cum_sum[1:] - cum_sum[window_start], 10)
+
+
+########################################################################################################################
 def event_number_to_series(events, index):
     """
     make a time-series where the value of the event number is paste to the <index>
@@ -190,6 +237,32 @@ def agg_events(events, series, agg='sum'):
     return res
 
 
+def events_max(events, index, values):
+    """
+    maximum of the values within every event (same as ``agg_events(events, series, 'max')`` but vectorized)
+
+    Args:
+        events (pandas.DataFrame): table of events
+        index (pandas.DatetimeIndex): index of the time-series
+        values (numpy.ndarray): time-series data
+
+    Returns:
+        numpy.ndarray: maximum of every event
+    """
+    if events.empty:
+        return np.array([])
+
+    start = index.searchsorted(events[COL.START].values, side='left')
+    end = index.searchsorted(events[COL.END].values, side='right')
+
+    # reduce the slices [start, end) of the events and skip the slices [end, next start) in between
+    # NaN at the end, because the last end may be equal to the size of the values
+    bounds = np.column_stack((start, end)).ravel()
+    res = np.fmax.reduceat(np.append(values.astype(np.float64), np.NaN), bounds)[::2]
+    res[start == end] = np.NaN
+    return res
+
+
 ########################################################################################################################
 def event_duration(events):
     """